@@ -31,6 +31,10 @@ data = {
         {1: 0.10, 2: 0.10, 3: 0.07, 4: 0.20, 5: 0.20, 6: 0.34}
 }
 
+# Sensitivity mode: re-rank the features under many alternative weight schemes
+sensitivity_mode = False
+n_random_schemes = 5000  # Random non-increasing weight vectors for the stability sweep
+
 def calculate_weighted_scores():
     weighted_scores = {}
     for feature in features:
@@ -38,9 +42,94 @@ def calculate_weighted_scores():
         weighted_scores[feature] = score
     return weighted_scores
 
-def create_ranking_visualization():
-    # Set up the figure with two subplots
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 12), height_ratios=[1, 1.5])
+def named_weight_schemes():
+    # Each scheme is one weight per rank (rank 1 first), weights non-increasing
+    ranks = np.array(sorted(weights))
+    n_ranks = len(ranks)
+    schemes = {
+        'Default': np.array([weights[r] for r in ranks], dtype=float),
+        'Top-heavy': (n_ranks - ranks + 1.0) ** 2,
+    }
+    for base in (1.5, 2, 3):
+        schemes[f'Exponential (base {base})'] = base ** (n_ranks - ranks)
+    for k in range(1, n_ranks):
+        schemes[f'Top-{k} only'] = (ranks <= k).astype(float)
+    return schemes
+
+def random_weight_schemes(n_random=n_random_schemes, seed=0):
+    # Sorted Dirichlet draws cover every non-increasing weight vector, one row per scheme
+    rng = np.random.default_rng(seed)
+    return -np.sort(-rng.dirichlet(np.ones(len(weights)), size=n_random), axis=1)
+
+def calculate_positions(schemes):
+    ranks = sorted(weights)
+    
+    # Features x ranks matrix times ranks x schemes gives every score in one multiply
+    shares = np.array([[data[feature][rank] for rank in ranks] for feature in features])
+    scores = np.round(shares @ schemes.T, 9)  # Rounding keeps float noise from splitting ties
+    
+    # Position of each feature under each scheme (1 = highest score, tied features share a position)
+    return (scores[None, :, :] > scores[:, None, :]).sum(axis=1) + 1
+
+def calculate_sensitivity(schemes):
+    n_features = len(features)
+    positions = calculate_positions(schemes)
+    baseline_positions = calculate_positions(named_weight_schemes()['Default'][None, :])[:, 0]
+    
+    # Share of schemes placing each feature at each position
+    position_freq = (positions[:, :, None] == np.arange(1, n_features + 1)).mean(axis=1)
+    
+    sensitivity = {}
+    for i, feature in enumerate(features):
+        baseline_position = baseline_positions[i]
+        sensitivity[feature] = {
+            'baseline_position': baseline_position,
+            'mean_position': positions[i].mean(),
+            'std_position': positions[i].std(),
+            'best_position': positions[i].min(),
+            'worst_position': positions[i].max(),
+            'stability': position_freq[i, baseline_position - 1],
+            'position_freq': position_freq[i],
+        }
+    return sensitivity
+
+def plot_rank_stability(ax, features_sorted, sensitivity, n_schemes):
+    n_features = len(features_sorted)
+    freq = np.array([sensitivity[feat]['position_freq'] for feat in features_sorted])
+    
+    im = ax.imshow(freq.T * 100, cmap='Blues', vmin=0, vmax=100, aspect='auto')
+    
+    # Add percentage labels, outlining each feature's position under the default weights
+    for i, feat in enumerate(features_sorted):
+        for j in range(n_features):
+            pct = freq[i, j] * 100
+            if pct >= 1:
+                ax.text(i, j, f'{pct:.0f}%', ha='center', va='center', fontsize=8,
+                        color='white' if pct > 60 else 'black')
+        baseline = sensitivity[feat]['baseline_position'] - 1
+        ax.add_patch(plt.Rectangle((i - 0.5, baseline - 0.5), 1, 1,
+                                   fill=False, edgecolor='#e74c3c', linewidth=2))
+    
+    ax.set_title(f'Rank Stability Across {n_schemes:,} Random Weight Schemes', fontsize=14, pad=20)
+    ax.set_xlabel('Feature', fontsize=12)
+    ax.set_ylabel('Position', fontsize=12)
+    ax.set_xticks(range(n_features))
+    ax.set_xticklabels([feat.replace('&', '\n&') for feat in features_sorted], 
+                       rotation=45, ha='right')
+    ax.set_yticks(range(n_features))
+    ax.set_yticklabels([f'#{pos}' for pos in range(1, n_features + 1)])
+    plt.colorbar(im, ax=ax, label='Share of Schemes (%)')
+
+def create_ranking_visualization(sensitivity=None, n_schemes=0):
+    # Set up the figure: weighted scores on top (next to rank stability in sensitivity mode)
+    if sensitivity is not None:
+        fig = plt.figure(figsize=(20, 12))
+        grid = fig.add_gridspec(2, 2, height_ratios=[1, 1.5])
+        ax1 = fig.add_subplot(grid[0, 0])
+        ax3 = fig.add_subplot(grid[0, 1])
+        ax2 = fig.add_subplot(grid[1, :])
+    else:
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 12), height_ratios=[1, 1.5])
     
     # Colors for the bars
     colors = ['#2ecc71', '#3498db', '#9b59b6', '#e74c3c', '#f1c40f', '#1abc9c']
@@ -70,6 +159,10 @@ def create_ranking_visualization():
                         rotation=45, ha='right')
     ax1.grid(axis='y', linestyle='--', alpha=0.7)
     
+    # Plot 3: Rank Stability (same feature order as plot 1)
+    if sensitivity is not None:
+        plot_rank_stability(ax3, features_sorted, sensitivity, n_schemes)
+    
     # Plot 2: Percentage Breakdown
     x = np.arange(len(features))
     width = 0.12
@@ -103,8 +196,15 @@ def create_ranking_visualization():
 
 def main():
     try:
+        sensitivity = None
+        if sensitivity_mode:
+            named_schemes = named_weight_schemes()
+            named_positions = calculate_positions(np.array(list(named_schemes.values())))
+            random_schemes = random_weight_schemes()
+            sensitivity = calculate_sensitivity(random_schemes)
+        
         # Create and save visualization
-        fig = create_ranking_visualization()
+        fig = create_ranking_visualization(sensitivity, n_schemes=n_random_schemes)
         plt.savefig('desired_features_analysis.png', bbox_inches='tight', dpi=300, 
                    facecolor='white', edgecolor='none')
         plt.close()
@@ -122,6 +222,25 @@ def main():
             for rank in range(1, 7):
                 percentage = data[feature][rank] * 100
                 print(f"  Rank {rank}: {percentage:.1f}%")
+        
+        if sensitivity_mode:
+            print("\nPositions Under Named Weight Schemes:")
+            print("-" * 50)
+            for j, (name, scheme) in enumerate(named_schemes.items()):
+                print(f"\n{name} (weights {', '.join(f'{w:.3g}' for w in scheme)}):")
+                for i in np.argsort(named_positions[:, j], kind='stable'):
+                    print(f"  #{named_positions[i, j]}: {features[i]}")
+            
+            print(f"\nWeight-Scheme Sensitivity ({len(random_schemes):,} random schemes):")
+            print("-" * 50)
+            for feature, _ in sorted_features:
+                stats = sensitivity[feature]
+                print(f"\n{feature}:")
+                print(f"Default Position: #{stats['baseline_position']} "
+                      f"(held in {stats['stability'] * 100:.1f}% of schemes)")
+                print(f"Mean Position: {stats['mean_position']:.2f} "
+                      f"(std {stats['std_position']:.2f})")
+                print(f"Position Range: #{stats['best_position']} to #{stats['worst_position']}")
             
     except Exception as e:
         print(f"An error occurred: {str(e)}")